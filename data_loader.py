@@ -11,8 +11,52 @@ Complexity: Basic
 
 import pandas as pd
 import numpy as np
-from typing import Optional, Dict, List
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+from typing import Any, Optional, Dict, List, Callable, Iterator, Tuple
 import os
+import tempfile
+import datetime
+
+# Block size handed to the Arrow CSV reader; each block is tokenized on its own thread
+CSV_BLOCK_SIZE = 16 << 20
+
+
+def _arrow_type(dtype) -> Optional[pa.DataType]:
+    """
+    Arrow type the CSV reader can parse a column into for a numpy dtype spec.
+    
+    Returns None for dtypes with no Arrow equivalent, such as object or
+    pandas extension dtypes ('category', 'Int64', 'string').
+    """
+    try:
+        return pa.from_numpy_dtype(np.dtype(dtype))
+    except (TypeError, pa.ArrowNotImplementedError):
+        return None
+
+
+def _copy_on_write_enabled() -> bool:
+    """
+    Whether pandas Copy-on-Write is active (always on from pandas 3.0).
+    """
+    if int(pd.__version__.split('.')[0]) >= 3:
+        return True
+    return pd.get_option('mode.copy_on_write') is True
+
+
+def _same_column_data(a: pd.Series, b: pd.Series) -> bool:
+    """
+    Whether two column Series are still backed by the same data.
+    
+    Under Copy-on-Write, editing a column that another Series still
+    references makes pandas copy it first, so the data no longer matches.
+    """
+    if len(a) != len(b) or a.dtype != b.dtype:
+        return False
+    if isinstance(a.dtype, np.dtype):
+        return np.may_share_memory(a.to_numpy(), b.to_numpy())
+    return a.array is b.array
 
 
 class NetflixDataLoader:
@@ -21,6 +65,8 @@ class NetflixDataLoader:
     
     Features:
     - Load CSV data
+    - Parquet cache for repeated loads
+    - Chunked and streaming loading for large files
     - Basic validation
     - Handle missing values
     - Simple data inspection
@@ -35,13 +81,28 @@ class NetflixDataLoader:
         """
         self.data_path = data_path
         self.data = None
+        self._schema: Dict[str, Tuple[Tuple[int, int], Dict[str, pa.DataType]]] = {}
+        self._filter_index: Dict[str, Tuple[pd.Series, Dict[Any, np.ndarray]]] = {}
         
-    def load_csv(self, filename: str) -> pd.DataFrame:
+    def load_csv(self, filename: str, columns: Optional[List[str]] = None,
+                 dtype: Optional[Dict] = None,
+                 parse_dates: Optional[List[str]] = None) -> pd.DataFrame:
         """
         Load data from CSV file.
         
+        The file is parsed with the multithreaded PyArrow CSV reader and handed
+        to pandas without intermediate Python objects. Empty cells are missing
+        values, and ISO-formatted date and timestamp columns are returned as
+        datetime64 rather than strings. The column types found on
+        the first load are remembered, so reloading the same unchanged file
+        skips type inference. If Arrow cannot parse the file, loading falls back to
+        pandas.read_csv.
+        
         Args:
             filename (str): Name of the CSV file
+            columns (list, optional): Only parse these columns
+            dtype (dict, optional): Column name to dtype mapping, skips type inference
+            parse_dates (list, optional): Columns to parse as datetimes
             
         Returns:
             pd.DataFrame: Loaded dataframe
@@ -49,7 +110,35 @@ class NetflixDataLoader:
         filepath = os.path.join(self.data_path, filename)
         
         try:
-            self.data = pd.read_csv(filepath)
+            try:
+                # Dtypes Arrow can parse into directly go to the reader; the rest
+                # (object, category, nullable extension types) are cast afterwards
+                requested, cast_after = {}, {}
+                for col, t in (dtype or {}).items():
+                    arrow_type = _arrow_type(t)
+                    if arrow_type is None:
+                        cast_after[col] = t
+                    else:
+                        requested[col] = arrow_type
+                requested.update({col: pa.timestamp('ns') for col in parse_dates or []})
+                schema = self._file_schema(filename, filepath)
+                column_types = {**schema, **requested}
+                table = self._read_csv_table(filepath, columns=columns, column_types=column_types)
+                # Only remember inferred types; explicit requests apply to this call only
+                schema.update(
+                    (name, t) for name, t in zip(table.schema.names, table.schema.types)
+                    if name not in requested
+                )
+                self.data = table.to_pandas(split_blocks=True, self_destruct=True, date_as_object=False)
+                del table
+                for col, t in cast_after.items():
+                    if col in self.data.columns:
+                        self.data[col] = self.data[col].astype(t)
+            except pa.ArrowInvalid:
+                self._schema.pop(filename, None)
+                self.data = pd.read_csv(filepath, usecols=columns, dtype=dtype,
+                                        parse_dates=parse_dates, engine='c')
+            self._filter_index.clear()
             print(f"✅ Successfully loaded {filename}")
             print(f"📊 Shape: {self.data.shape}")
             return self.data
@@ -60,6 +149,210 @@ class NetflixDataLoader:
             print(f"❌ Error loading file: {str(e)}")
             return None
     
+    def load(self, filename: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Load data from CSV file through an on-disk Parquet cache.
+        
+        The first call parses the CSV and writes a zstd-compressed
+        '<filename>.parquet' next to it. Later calls read the Parquet file
+        instead, as long as it is not older than the CSV.
+        
+        Args:
+            filename (str): Name of the CSV file
+            columns (list, optional): Only read these columns from disk
+            
+        Returns:
+            pd.DataFrame: Loaded dataframe
+        """
+        filepath = os.path.join(self.data_path, filename)
+        cache = filepath + '.parquet'
+        
+        try:
+            table = None
+            if os.path.isfile(cache) and os.path.getmtime(cache) >= os.path.getmtime(filepath):
+                try:
+                    names = pq.read_schema(cache).names
+                except pa.ArrowInvalid:
+                    print(f"⚠️  Ignoring unreadable cache {cache}")
+                else:
+                    missing = [col for col in columns or [] if col not in names]
+                    if missing:
+                        print(f"❌ Column(s) {missing} not found in {filename}")
+                        return None
+                    table = pq.read_table(cache, columns=columns)
+                    source = 'parquet cache'
+            if table is None:
+                table = self._read_csv_table(filepath)
+                source = 'CSV (cache written)' if self._write_parquet_cache(table, cache) else 'CSV'
+                if columns is not None:
+                    missing = [col for col in columns if col not in table.column_names]
+                    if missing:
+                        print(f"❌ Column(s) {missing} not found in {filename}")
+                        return None
+                    table = table.select(columns)
+            self.data = table.to_pandas(split_blocks=True, self_destruct=True, date_as_object=False)
+            del table
+            self._filter_index.clear()
+            print(f"✅ Successfully loaded {filename} from {source}")
+            print(f"📊 Shape: {self.data.shape}")
+            return self.data
+        except FileNotFoundError:
+            print(f"❌ Error: File {filename} not found at {filepath}")
+            return None
+        except pa.ArrowInvalid:
+            return self.load_csv(filename, columns=columns)
+        except Exception as e:
+            print(f"❌ Error loading file: {str(e)}")
+            return None
+    
+    def _write_parquet_cache(self, table: pa.Table, cache: str) -> bool:
+        """
+        Write a Parquet cache file atomically.
+        
+        The table is written to a temporary file in the same directory and
+        moved into place with os.replace, so a failed write never leaves a
+        truncated cache behind. Write errors are reported but not raised.
+        
+        Args:
+            table (pa.Table): Table to cache
+            cache (str): Path of the cache file
+            
+        Returns:
+            bool: Whether the cache was written
+        """
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache) or '.', suffix='.parquet.tmp')
+            os.close(fd)
+            pq.write_table(table, tmp_path, compression='zstd')
+            os.replace(tmp_path, cache)
+            return True
+        except (OSError, pa.ArrowException) as e:
+            print(f"⚠️  Could not write cache {cache}: {str(e)}")
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return False
+    
+    def load_csv_chunked(self, filename: str, chunksize: int = 1_000_000,
+                         filter_fn: Optional[Callable[[pd.DataFrame], pd.Series]] = None,
+                         dtype: Optional[Dict] = None) -> pd.DataFrame:
+        """
+        Load a large CSV file chunk by chunk, keeping only rows that pass a filter.
+        
+        Peak memory is bounded by one chunk plus the surviving rows rather than
+        the whole file. Chunks of a few hundred MB in memory are a good target;
+        the bytes per row depend on the columns, so size chunksize from
+        DataFrame.memory_usage(deep=True) on a small sample.
+        
+        Args:
+            filename (str): Name of the CSV file
+            chunksize (int): Number of rows per chunk
+            filter_fn (callable, optional): Takes a chunk and returns a boolean mask of rows to keep
+            dtype (dict, optional): Column name to dtype mapping, skips type inference
+            
+        Returns:
+            pd.DataFrame: Loaded dataframe
+        """
+        filepath = os.path.join(self.data_path, filename)
+        
+        try:
+            parts = []
+            with pd.read_csv(filepath, chunksize=chunksize, dtype=dtype) as reader:
+                for chunk in reader:
+                    if filter_fn is not None:
+                        chunk = chunk[filter_fn(chunk)]
+                    parts.append(chunk)
+            self.data = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame()
+            self._filter_index.clear()
+            print(f"✅ Successfully loaded {filename} in {len(parts)} chunks")
+            print(f"📊 Shape: {self.data.shape}")
+            return self.data
+        except FileNotFoundError:
+            print(f"❌ Error: File {filename} not found at {filepath}")
+            return None
+        except Exception as e:
+            print(f"❌ Error loading file: {str(e)}")
+            return None
+    
+    def load_csv_stream(self, filename: str, batch_size: int = 64 << 20,
+                        columns: Optional[List[str]] = None) -> Iterator[pd.DataFrame]:
+        """
+        Stream a CSV file as a sequence of dataframes without loading it whole.
+        
+        Each yielded dataframe holds one Arrow block of roughly batch_size
+        bytes, so peak memory follows the block size rather than the file size.
+        Blocks of 64-256 MB usually balance throughput and memory. Column types
+        are inferred from the first block unless the file was loaded with
+        load_csv before and has not changed since, in which case the
+        remembered schema is used.
+        
+        Args:
+            filename (str): Name of the CSV file
+            batch_size (int): Approximate size of each block in bytes
+            columns (list, optional): Only parse these columns
+            
+        Yields:
+            pd.DataFrame: One block of rows
+        """
+        filepath = os.path.join(self.data_path, filename)
+        
+        try:
+            read_options = pacsv.ReadOptions(use_threads=True, block_size=batch_size)
+            convert_options = pacsv.ConvertOptions(column_types=dict(self._file_schema(filename, filepath)),
+                                                   include_columns=columns,
+                                                   strings_can_be_null=True)
+            reader = pacsv.open_csv(filepath, read_options=read_options,
+                                    convert_options=convert_options)
+        except FileNotFoundError:
+            print(f"❌ Error: File {filename} not found at {filepath}")
+            return
+        
+        with reader:
+            for batch in reader:
+                yield batch.to_pandas(split_blocks=True, self_destruct=True, date_as_object=False)
+    
+    def _file_schema(self, filename: str, filepath: str) -> Dict[str, pa.DataType]:
+        """
+        Return the remembered column types of a file, forgetting them if the file changed.
+        
+        Entries are stamped with the file's modification time and size; a
+        stamp mismatch starts a fresh, empty schema.
+        
+        Args:
+            filename (str): Name of the CSV file
+            filepath (str): Full path to the CSV file
+            
+        Returns:
+            dict: Column name to Arrow type mapping, updated in place by callers
+        """
+        stat = os.stat(filepath)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        entry = self._schema.get(filename)
+        if entry is None or entry[0] != stamp:
+            entry = self._schema[filename] = (stamp, {})
+        return entry[1]
+    
+    def _read_csv_table(self, filepath: str, columns: Optional[List[str]] = None,
+                        column_types: Optional[Dict[str, pa.DataType]] = None) -> pa.Table:
+        """
+        Parse a CSV file into an Arrow table.
+        
+        Args:
+            filepath (str): Full path to the CSV file
+            columns (list, optional): Only parse these columns
+            column_types (dict, optional): Column name to Arrow type mapping
+            
+        Returns:
+            pa.Table: Parsed table
+        """
+        read_options = pacsv.ReadOptions(use_threads=True, block_size=CSV_BLOCK_SIZE)
+        convert_options = pacsv.ConvertOptions(column_types=column_types or {},
+                                               include_columns=columns,
+                                               strings_can_be_null=True)
+        return pacsv.read_csv(filepath, read_options=read_options,
+                              parse_options=pacsv.ParseOptions(),
+                              convert_options=convert_options)
+    
     def get_basic_info(self) -> Dict:
         """
         Get basic information about the loaded dataset.
@@ -97,12 +390,18 @@ class NetflixDataLoader:
         
         return self.data.head(n)
     
-    def handle_missing_values(self, strategy: str = 'drop') -> pd.DataFrame:
+    def handle_missing_values(self, strategy: str = 'drop', inplace: bool = False) -> pd.DataFrame:
         """
         Handle missing values in the dataset.
         
+        By default a new dataframe is returned and the loaded data is left
+        untouched. With inplace=True the 'fill' strategy writes zeros into the
+        loaded data itself (and so into any frame returned by a load method),
+        which avoids allocating a second copy of the frame.
+        
         Args:
             strategy (str): Strategy to handle missing values ('drop' or 'fill')
+            inplace (bool): Fill the loaded data in place instead of returning a copy
             
         Returns:
             pd.DataFrame: Cleaned dataframe
@@ -115,7 +414,16 @@ class NetflixDataLoader:
             cleaned_data = self.data.dropna()
             print(f"🧹 Dropped {len(self.data) - len(cleaned_data)} rows with missing values")
         elif strategy == 'fill':
-            cleaned_data = self.data.fillna(0)
+            if inplace:
+                # Only columns that have gaps are touched; under Copy-on-Write pandas
+                # writes into the existing blocks when no other frame shares them, so
+                # drop the filter index (which holds column references) first
+                self._filter_index.clear()
+                gaps = {col: 0 for col in self.data.columns if self.data[col].hasnans}
+                self.data.fillna(gaps, inplace=True)
+                cleaned_data = self.data
+            else:
+                cleaned_data = self.data.fillna(0)
             print("🧹 Filled missing values with 0")
         else:
             print("❌ Invalid strategy. Use 'drop' or 'fill'")
@@ -127,6 +435,13 @@ class NetflixDataLoader:
         """
         Filter data by column value.
         
+        Returns the same rows as data[column] == value. When pandas
+        Copy-on-Write is active, the first filter on a column builds a
+        value -> row positions index with one groupby pass, and later filters
+        on that column are a dict lookup and an iloc slice. The index keeps a
+        reference to the column it was built from, so any edit to that column
+        forces a copy and the index is rebuilt on the next call.
+        
         Args:
             column (str): Column name to filter
             value: Value to filter by
@@ -142,10 +457,57 @@ class NetflixDataLoader:
             print(f"❌ Column '{column}' not found in dataset")
             return None
         
-        filtered_data = self.data[self.data[column] == value]
+        key = self._filter_key(self.data[column], value)
+        if key is None:
+            filtered_data = self.data[self.data[column] == value]
+        else:
+            series = self.data[column]
+            cached = self._filter_index.get(column)
+            if cached is None or not _same_column_data(cached[0], series):
+                cached = self._filter_index[column] = (
+                    series, self.data.groupby(column, sort=False, observed=True).indices
+                )
+            positions = cached[1].get(key[0], np.empty(0, dtype=np.intp))
+            filtered_data = self.data.iloc[positions]
         print(f"🔍 Filtered {len(filtered_data)} rows where {column} = {value}")
         
         return filtered_data
+    
+    @staticmethod
+    def _filter_key(series: pd.Series, value) -> Optional[Tuple[Any]]:
+        """
+        Convert a filter value into the key the filter index stores for it.
+        
+        Datetime and timedelta values are parsed the way == would parse them.
+        Returns None when the index cannot be trusted to match ==, and the
+        caller falls back to a boolean mask.
+        
+        Args:
+            series (pd.Series): Column being filtered
+            value: Value to filter by
+            
+        Returns:
+            tuple: One-element tuple holding the lookup key, or None
+        """
+        if not _copy_on_write_enabled():
+            return None
+        
+        dtype = series.dtype
+        if isinstance(dtype, np.dtype):
+            try:
+                if dtype.kind == 'M':
+                    # == never matches a plain date against datetime64, Timestamp() would
+                    if isinstance(value, datetime.date) and not isinstance(value, datetime.datetime):
+                        return None
+                    return (pd.Timestamp(value),)
+                if dtype.kind == 'm':
+                    return (pd.Timedelta(value),)
+            except (ValueError, TypeError):
+                return None
+            return (value,)
+        if isinstance(dtype, (pd.CategoricalDtype, pd.StringDtype)):
+            return (value,)
+        return None
 
 
 def main():
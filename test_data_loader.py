@@ -0,0 +1,81 @@
+"""
+Regression checks for NetflixDataLoader.filter_by_column.
+
+Filters may be served from a cached value -> row positions index; these tests
+pin the result to the data[column] == value mask across dtypes and probe
+values, including after the filtered column has been edited.
+"""
+
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_loader import NetflixDataLoader
+
+
+def sample_frame(n: int = 2400) -> pd.DataFrame:
+    """
+    Viewing-log style frame with date, text, integer, float and bool columns.
+    """
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        'date': np.repeat(pd.date_range('2024-01-01', periods=n // 24).strftime('%Y-%m-%d'), 24),
+        'genre': rng.choice(['Drama', 'Comedy', 'Action', None], n),
+        'uid': rng.integers(0, 50, n),
+        'dur': np.round(rng.exponential(3, n)),
+        'flag': rng.integers(0, 2, n).astype(bool),
+        'ts': pd.date_range('2024-01-01', periods=n, freq='h').astype(str)
+    })
+
+
+@pytest.fixture
+def loader(tmp_path):
+    sample_frame().to_csv(tmp_path / 'viewing.csv', index=False)
+    loader = NetflixDataLoader(str(tmp_path))
+    loader.load_csv('viewing.csv')
+    return loader
+
+
+@pytest.mark.parametrize('column, value', [
+    ('date', '2024-01-03'),
+    ('date', pd.Timestamp('2024-01-03')),
+    ('date', datetime.date(2024, 1, 3)),
+    ('date', 'garbage'),
+    ('date', np.datetime64('2024-01-05')),
+    ('genre', 'Drama'),
+    ('genre', None),
+    ('genre', 5),
+    ('uid', 5),
+    ('uid', 5.0),
+    ('uid', '5'),
+    ('uid', True),
+    ('dur', 2.0),
+    ('dur', 2),
+    ('dur', np.nan),
+    ('flag', True),
+    ('flag', 1),
+    ('ts', '2024-01-02 03:00:00')
+])
+def test_filter_matches_mask(loader, column, value):
+    data = loader.data
+    expected = data[data[column] == value]
+
+    # Second call is served from the index built by the first
+    assert loader.filter_by_column(column, value).equals(expected)
+    assert loader.filter_by_column(column, value).equals(expected)
+
+
+@pytest.mark.parametrize('column, old, new', [
+    ('genre', 'Drama', 'Comedy'),
+    ('uid', 5, 6)
+])
+def test_filter_after_edit_matches_mask(loader, column, old, new):
+    data = loader.data
+    loader.filter_by_column(column, old)
+    data.loc[data[column] == old, column] = new
+
+    for value in (old, new):
+        assert loader.filter_by_column(column, value).equals(data[data[column] == value])
+    assert len(loader.filter_by_column(column, old)) == 0
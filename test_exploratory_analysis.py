@@ -0,0 +1,72 @@
+"""
+Regression checks for NetflixExploratoryAnalysis.generate_statistical_summary.
+
+The summary is computed from numpy/scipy reductions; these tests pin it to
+the pandas describe()/var()/skew()/kurtosis() reference on edge-case columns.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import exploratory_analysis
+from exploratory_analysis import NetflixExploratoryAnalysis
+
+
+def pandas_summary(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Reference summary built from pandas reductions.
+    """
+    summary = data.describe()
+    summary.loc['variance'] = data.var()
+    summary.loc['skewness'] = data.skew()
+    summary.loc['kurtosis'] = data.kurtosis()
+    return summary.round(2)
+
+
+EDGE_CASES = pd.DataFrame({
+    'all_nan': [np.nan] * 5,
+    'single_value': [1.0, np.nan, np.nan, np.nan, np.nan],
+    'two_values': [1.0, 2.0, np.nan, np.nan, np.nan],
+    'three_values': [1.0, 2.0, 4.0, np.nan, np.nan],
+    'constant': [3.7] * 5,
+    'regular': [1.0, 2.0, 4.0, 8.0, 9.0]
+})
+
+
+@pytest.mark.parametrize('data', [
+    EDGE_CASES,
+    EDGE_CASES[['all_nan']],
+    EDGE_CASES.iloc[:0]
+], ids=['mixed', 'all_nan_only', 'zero_rows'])
+def test_statistical_summary_matches_pandas(data):
+    summary = NetflixExploratoryAnalysis(data).generate_statistical_summary()
+    pd.testing.assert_frame_equal(summary, pandas_summary(data), check_dtype=False)
+
+
+CORR_CASES = pd.DataFrame({
+    'constant': np.full(1000, 0.1),
+    'rising': np.arange(1000, dtype=np.float64),
+    'noisy': np.random.default_rng(0).normal(size=1000),
+    'stepped': np.repeat([0.3, 0.7], 500)
+})
+
+
+@pytest.mark.parametrize('columns', [
+    ['rising', 'noisy'],
+    ['constant', 'rising', 'noisy'],
+    ['constant', 'rising', 'noisy', 'stepped'],
+    ['constant']
+], ids=['no_constant', 'constant_first', 'four_columns', 'constant_only'])
+@pytest.mark.parametrize('method', ['pearson', 'spearman'])
+@pytest.mark.parametrize('min_rows', [0, None], ids=['unrolled', 'blas'])
+def test_correlation_matches_pandas(columns, method, min_rows, monkeypatch):
+    import matplotlib.pyplot as plt
+    monkeypatch.setattr(plt, 'show', lambda: None)
+    if min_rows is not None:
+        monkeypatch.setattr(exploratory_analysis, 'CORR_UNROLL_MIN_ROWS', min_rows)
+    
+    data = CORR_CASES[columns]
+    corr = NetflixExploratoryAnalysis(data).correlation_analysis(method)
+    plt.close('all')
+    pd.testing.assert_frame_equal(corr, data.corr(method=method), check_exact=False, atol=1e-12)